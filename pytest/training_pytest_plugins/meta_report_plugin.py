@@ -16,10 +16,17 @@ metadata. It does **not** change test outcomes.
 
 from __future__ import annotations
 
-from typing import List, Optional
+import sys
+from typing import Optional
 
 import pytest
 
+# Marker names looked up on every test item. Identifier-like string
+# literals are already interned by CPython, so module-level constants are
+# enough to share one object across calls (no ``sys.intern`` needed).
+_OWNER_MARKER = "owner"
+_COMPONENT_MARKER = "component"
+
 
 def _format_meta_line(item: pytest.Item) -> Optional[str]:
     """Return a short metadata line based on common markers.
@@ -28,24 +35,38 @@ def _format_meta_line(item: pytest.Item) -> Optional[str]:
     nothing.
     """
 
-    owner_marker = item.get_closest_marker("owner")
-    component_marker = item.get_closest_marker("component")
+    owner_marker = item.get_closest_marker(_OWNER_MARKER)
+    component_marker = item.get_closest_marker(_COMPONENT_MARKER)
 
     owner = owner_marker.args[0] if owner_marker and owner_marker.args else None
     component = (
         component_marker.args[0] if component_marker and component_marker.args else None
     )
 
-    parts: List[str] = []
-    if owner:
-        parts.append(f"owner={owner}")
-    if component:
-        parts.append(f"component={component}")
-
-    if not parts:
+    # Most tests carry neither marker, so bail out before building anything.
+    if not owner and not component:
         return None
 
-    return f"[meta] {item.nodeid} ({', '.join(parts)})"
+    if owner and component:
+        details = f"owner={owner}, component={component}"
+    elif owner:
+        details = f"owner={owner}"
+    else:
+        details = f"component={component}"
+
+    return f"[meta] {item.nodeid} ({details})"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Unregister this plugin for ``--collect-only`` runs.
+
+    No tests are executed in that mode, so the setup hook below would
+    never have anything to report. Dropping the plugin keeps
+    collection-only invocations free of its overhead.
+    """
+
+    if config.getoption("collectonly"):
+        config.pluginmanager.unregister(sys.modules[__name__])
 
 
 def pytest_runtest_setup(item: pytest.Item) -> None:
@@ -14,6 +14,7 @@ When to use subprocess.run():
 - For most common subprocess use cases
 """
 
+import shutil
 import subprocess
 from typing import List
 
@@ -99,22 +100,16 @@ def check_command_exists(command: str) -> bool:
     """
     Check if a command exists on the system.
     
+    Uses shutil.which() to search PATH in-process - no need to spawn
+    the command (e.g. with --version) just to see if it is installed.
+    
     Args:
         command: Command name to check
         
     Returns:
         True if command exists
     """
-    try:
-        # Try to run with --version or --help
-        subprocess.run(
-            [command, "--version"],
-            capture_output=True,  # ← Don't show output
-            check=False           # ← Don't raise exception
-        )
-        return True
-    except FileNotFoundError:
-        return False
+    return shutil.which(command) is not None  # ← PATH lookup, no subprocess
 
 
 # ============================================================================
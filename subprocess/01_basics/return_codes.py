@@ -18,6 +18,14 @@ Why return codes matter:
 import subprocess
 from typing import Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BASIC RETURN CODE CHECKING
@@ -67,9 +75,7 @@ def use_check_parameter() -> None:
     
     This is the recommended way for most cases.
     """
-    print("\n" + "=" * 70)
-    print("USING check=True")
-    print("=" * 70)
+    print_section("USING check=True")
     
     # Success case
     print("\n1. Successful command:")
@@ -110,9 +116,7 @@ def demonstrate_exit_codes() -> None:
     - 127: Command not found
     - 130: Terminated by Ctrl+C
     """
-    print("\n" + "=" * 70)
-    print("DIFFERENT EXIT CODES")
-    print("=" * 70)
+    print_section("DIFFERENT EXIT CODES")
     
     test_cases = [
         (["echo", "success"], "Successful command"),
@@ -158,13 +162,15 @@ def handle_return_codes() -> None:
     """
     Demonstrate different ways to handle return codes.
     """
-    print("\n" + "=" * 70)
-    print("HANDLING RETURN CODES")
-    print("=" * 70)
+    print_section("HANDLING RETURN CODES")
     
     # Method 1: Manual check
     print("\n1. Manual check:")
-    result = subprocess.run(["ls", "/tmp"])
+    result = subprocess.run(
+        ["ls", "/tmp"],
+        stdout=subprocess.DEVNULL,  # ← Only the return code matters here
+        stderr=subprocess.DEVNULL
+    )
     if result.returncode != 0:
         print(f"  Error: Command failed with code {result.returncode}")
     else:
@@ -173,7 +179,12 @@ def handle_return_codes() -> None:
     # Method 2: Using check=True with try/except
     print("\n2. Using check=True:")
     try:
-        subprocess.run(["ls", "/tmp"], check=True)
+        subprocess.run(
+            ["ls", "/tmp"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True
+        )
         print("  Success!")
     except subprocess.CalledProcessError as e:
         print(f"  Error: {e}")
@@ -194,14 +205,12 @@ def handle_return_codes() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("RETURN CODES AND EXIT STATUS")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Basic return code checking
-    print("\n" + "=" * 70)
-    print("1. BASIC RETURN CODE CHECKING")
-    print("=" * 70)
+    print_section("1. BASIC RETURN CODE CHECKING")
     check_return_code_manual()
     check_failed_command()
     
@@ -215,26 +224,26 @@ if __name__ == "__main__":
     handle_return_codes()
 
     # Custom exit codes
-    print("\n" + "=" * 70)
-    print("4. CUSTOM EXIT CODES")
-    print("=" * 70)
+    print_section("4. CUSTOM EXIT CODES")
 
     for code in [0, 1, 42, 127]:
         returned = run_python_with_exit_code(code)
         print(f"  Requested exit code {code}, got: {returned}")
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Return code 0 = success, non-zero = failure")
-    print("2. Access return code via result.returncode")
-    print("3. Use check=True to auto-raise exception on failure")
-    print("4. CalledProcessError contains returncode attribute")
-    print("5. Different commands use different error codes")
-    print("6. Always check return codes in production code")
-    print("7. Common codes: 0=success, 1=error, 127=not found")
-    print("8. Use try/except with check=True for robust error handling")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Return code 0 = success, non-zero = failure",
+        "2. Access return code via result.returncode",
+        "3. Use check=True to auto-raise exception on failure",
+        "4. CalledProcessError contains returncode attribute",
+        "5. Different commands use different error codes",
+        "6. Always check return codes in production code",
+        "7. Common codes: 0=success, 1=error, 127=not found",
+        "8. Use try/except with check=True for robust error handling",
+        SEPARATOR,
+    ]))
 
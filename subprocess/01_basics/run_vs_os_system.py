@@ -20,6 +20,18 @@ import subprocess
 import os
 from typing import Tuple
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
+# List form of "echo 'Test message'" - the quotes are shell syntax, so the
+# argument itself is just: Test message
+SIDE_BY_SIDE_COMMAND = ["echo", "Test message"]
+
 
 # ============================================================================
 # os.system() - THE OLD WAY
@@ -36,7 +48,7 @@ def demonstrate_os_system() -> None:
     - Less control
     """
     print("Using os.system():")
-    print("-" * 70)
+    print(SUB_SEPARATOR)
     
     # Run command
     exit_status = os.system("echo 'Hello from os.system()'")
@@ -64,9 +76,9 @@ def demonstrate_subprocess_run() -> None:
     - Returns CompletedProcess object
     - Better error handling
     """
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
     print("Using subprocess.run():")
-    print("-" * 70)
+    print(SUB_SEPARATOR)
     
     # Run command
     result = subprocess.run(
@@ -87,8 +99,8 @@ def demonstrate_subprocess_run() -> None:
         text=True
     )
     
-    lines = result.stdout.split('\n')[:5]
-    for line in lines:
+    # Split off only the first 5 lines instead of the whole listing
+    for line in result.stdout.split('\n', 5)[:5]:
         print(f"  {line}")
     
     print(f"\nReturn code: {result.returncode}")
@@ -102,9 +114,7 @@ def compare_side_by_side() -> None:
     """
     Compare os.system() and subprocess.run() side by side.
     """
-    print("\n" + "=" * 70)
-    print("SIDE-BY-SIDE COMPARISON")
-    print("=" * 70)
+    print_section("SIDE-BY-SIDE COMPARISON")
     
     command = "echo 'Test message'"
     
@@ -117,9 +127,9 @@ def compare_side_by_side() -> None:
     
     # subprocess.run()
     print("\n2. subprocess.run():")
-    print(f"   Code: subprocess.run({command.split()})")
+    print(f"   Code: subprocess.run({SIDE_BY_SIDE_COMMAND})")
     result = subprocess.run(
-        command.split(),
+        SIDE_BY_SIDE_COMMAND,
         capture_output=True,
         text=True
     )
@@ -138,9 +148,7 @@ def demonstrate_security_difference() -> None:
     os.system() always uses shell - dangerous!
     subprocess.run() doesn't use shell by default - safe!
     """
-    print("\n" + "=" * 70)
-    print("SECURITY COMPARISON")
-    print("=" * 70)
+    print_section("SECURITY COMPARISON")
     
     # Dangerous with os.system()
     print("\n1. os.system() - DANGEROUS:")
@@ -169,9 +177,7 @@ def compare_output_capture() -> None:
     """
     Compare how to capture output with both methods.
     """
-    print("\n" + "=" * 70)
-    print("OUTPUT CAPTURE COMPARISON")
-    print("=" * 70)
+    print_section("OUTPUT CAPTURE COMPARISON")
     
     # os.system() - difficult
     print("\n1. os.system() - Difficult:")
@@ -203,9 +209,7 @@ def when_to_use_each() -> None:
     """
     Explain when to use each method.
     """
-    print("\n" + "=" * 70)
-    print("WHEN TO USE EACH")
-    print("=" * 70)
+    print_section("WHEN TO USE EACH")
     
     print("\n✅ Use subprocess.run():")
     print("   - Almost always (it's the modern way)")
@@ -231,14 +235,12 @@ def when_to_use_each() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("subprocess.run() vs os.system()")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # os.system()
-    print("\n" + "=" * 70)
-    print("1. os.system() - THE OLD WAY")
-    print("=" * 70)
+    print_section("1. os.system() - THE OLD WAY")
     demonstrate_os_system()
     
     # subprocess.run()
@@ -256,20 +258,22 @@ if __name__ == "__main__":
     # When to use
     when_to_use_each()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. subprocess.run() is the modern, recommended way")
-    print("2. os.system() is deprecated for most uses")
-    print("3. subprocess.run() is safer (no shell by default)")
-    print("4. subprocess.run() makes output capture easy")
-    print("5. os.system() always uses shell (security risk)")
-    print("6. subprocess.run() returns structured CompletedProcess")
-    print("7. os.system() returns encoded exit status")
-    print("8. Use subprocess.run() for all new code")
-    print("9. Never use os.system() with user input")
-    print("10. subprocess provides better error handling")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. subprocess.run() is the modern, recommended way",
+        "2. os.system() is deprecated for most uses",
+        "3. subprocess.run() is safer (no shell by default)",
+        "4. subprocess.run() makes output capture easy",
+        "5. os.system() always uses shell (security risk)",
+        "6. subprocess.run() returns structured CompletedProcess",
+        "7. os.system() returns encoded exit status",
+        "8. Use subprocess.run() for all new code",
+        "9. Never use os.system() with user input",
+        "10. subprocess provides better error handling",
+        SEPARATOR,
+    ]))
 
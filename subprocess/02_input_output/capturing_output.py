@@ -20,6 +20,14 @@ Why capture output:
 import subprocess
 from typing import Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BASIC OUTPUT CAPTURE
@@ -50,9 +58,7 @@ def without_capture() -> None:
     
     stdout and stderr will be None.
     """
-    print("\n" + "=" * 70)
-    print("WITHOUT CAPTURE")
-    print("=" * 70)
+    print_section("WITHOUT CAPTURE")
     
     print("\nRunning: echo 'This goes to terminal'")
     result = subprocess.run(["echo", "This goes to terminal"])
@@ -71,9 +77,7 @@ def capture_stdout_only() -> None:
     
     Use stdout=subprocess.PIPE for more control.
     """
-    print("\n" + "=" * 70)
-    print("CAPTURE STDOUT ONLY")
-    print("=" * 70)
+    print_section("CAPTURE STDOUT ONLY")
     
     result = subprocess.run(
         ["ls", "-lh", "/tmp"],
@@ -96,9 +100,7 @@ def capture_stderr_only() -> None:
     
     Useful for capturing error messages.
     """
-    print("\n" + "=" * 70)
-    print("CAPTURE STDERR ONLY")
-    print("=" * 70)
+    print_section("CAPTURE STDERR ONLY")
     
     # This command outputs to stderr
     result = subprocess.run(
@@ -121,9 +123,7 @@ def capture_both_separately() -> None:
     
     More control than capture_output=True.
     """
-    print("\n" + "=" * 70)
-    print("CAPTURE BOTH SEPARATELY")
-    print("=" * 70)
+    print_section("CAPTURE BOTH SEPARATELY")
     
     result = subprocess.run(
         ["python3", "--version"],
@@ -147,9 +147,7 @@ def process_captured_output() -> None:
     
     Shows common patterns for working with output.
     """
-    print("\n" + "=" * 70)
-    print("PROCESSING CAPTURED OUTPUT")
-    print("=" * 70)
+    print_section("PROCESSING CAPTURED OUTPUT")
     
     # Capture directory listing
     result = subprocess.run(
@@ -184,14 +182,12 @@ def process_captured_output() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("CAPTURING OUTPUT")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Basic capture
-    print("\n" + "=" * 70)
-    print("1. BASIC OUTPUT CAPTURE")
-    print("=" * 70)
+    print_section("1. BASIC OUTPUT CAPTURE")
     capture_basic_output()
     
     # Without capture
@@ -209,20 +205,22 @@ if __name__ == "__main__":
     # Processing output
     process_captured_output()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. capture_output=True captures both stdout and stderr")
-    print("2. stdout=subprocess.PIPE captures only stdout")
-    print("3. stderr=subprocess.PIPE captures only stderr")
-    print("4. Without capture, output goes to terminal")
-    print("5. Use text=True to get strings instead of bytes")
-    print("6. Captured output is in result.stdout and result.stderr")
-    print("7. Process output with splitlines(), strip(), etc.")
-    print("8. Check patterns with 'in' operator")
-    print("9. Filter lines with list comprehensions")
-    print("10. Always check returncode before processing output")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. capture_output=True captures both stdout and stderr",
+        "2. stdout=subprocess.PIPE captures only stdout",
+        "3. stderr=subprocess.PIPE captures only stderr",
+        "4. Without capture, output goes to terminal",
+        "5. Use text=True to get strings instead of bytes",
+        "6. Captured output is in result.stdout and result.stderr",
+        "7. Process output with splitlines(), strip(), etc.",
+        "8. Check patterns with 'in' operator",
+        "9. Filter lines with list comprehensions",
+        "10. Always check returncode before processing output",
+        SEPARATOR,
+    ]))
 
@@ -20,6 +20,14 @@ import subprocess
 import sys
 from typing import Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # DEFAULT ENCODING
@@ -62,9 +70,7 @@ def specify_encoding() -> None:
     
     Recommended for portability.
     """
-    print("\n" + "=" * 70)
-    print("SPECIFYING ENCODING")
-    print("=" * 70)
+    print_section("SPECIFYING ENCODING")
     
     # UTF-8 encoding (recommended)
     result = subprocess.run(
@@ -99,9 +105,7 @@ def handle_encoding_errors() -> None:
     
     Options: 'strict', 'ignore', 'replace', 'backslashreplace'
     """
-    print("\n" + "=" * 70)
-    print("HANDLING ENCODING ERRORS")
-    print("=" * 70)
+    print_section("HANDLING ENCODING ERRORS")
     
     # Create a command that outputs non-ASCII
     command = ["echo", "Café"]
@@ -162,9 +166,7 @@ def demonstrate_common_encodings() -> None:
     """
     Demonstrate common character encodings.
     """
-    print("\n" + "=" * 70)
-    print("COMMON ENCODINGS")
-    print("=" * 70)
+    print_section("COMMON ENCODINGS")
     
     text = "Hello"
     command = ["echo", text]
@@ -192,9 +194,7 @@ def bytes_vs_encoding() -> None:
     """
     Compare bytes mode vs encoding parameter.
     """
-    print("\n" + "=" * 70)
-    print("BYTES VS ENCODING")
-    print("=" * 70)
+    print_section("BYTES VS ENCODING")
     
     command = ["echo", "Hello"]
     
@@ -221,14 +221,12 @@ def bytes_vs_encoding() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("ENCODING HANDLING")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Default encoding
-    print("\n" + "=" * 70)
-    print("1. DEFAULT ENCODING")
-    print("=" * 70)
+    print_section("1. DEFAULT ENCODING")
     demonstrate_default_encoding()
     
     # Specifying encoding
@@ -243,20 +241,22 @@ if __name__ == "__main__":
     # Bytes vs encoding
     bytes_vs_encoding()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Default encoding is locale-dependent (usually UTF-8)")
-    print("2. Use encoding='utf-8' for explicit UTF-8")
-    print("3. errors parameter controls error handling")
-    print("4. errors='strict': Raise exception (default)")
-    print("5. errors='ignore': Skip invalid characters")
-    print("6. errors='replace': Replace with ?")
-    print("7. errors='backslashreplace': Use escape sequences")
-    print("8. Common encodings: utf-8, ascii, latin-1")
-    print("9. Always specify encoding for portability")
-    print("10. Use bytes mode if encoding is unknown")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Default encoding is locale-dependent (usually UTF-8)",
+        "2. Use encoding='utf-8' for explicit UTF-8",
+        "3. errors parameter controls error handling",
+        "4. errors='strict': Raise exception (default)",
+        "5. errors='ignore': Skip invalid characters",
+        "6. errors='replace': Replace with ?",
+        "7. errors='backslashreplace': Use escape sequences",
+        "8. Common encodings: utf-8, ascii, latin-1",
+        "9. Always specify encoding for portability",
+        "10. Use bytes mode if encoding is unknown",
+        SEPARATOR,
+    ]))
 
@@ -19,6 +19,14 @@ Common use cases:
 import subprocess
 from typing import Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BASIC INPUT
@@ -52,9 +60,7 @@ def input_with_grep() -> None:
     
     Common pattern for text processing.
     """
-    print("\n" + "=" * 70)
-    print("INPUT WITH GREP")
-    print("=" * 70)
+    print_section("INPUT WITH GREP")
     
     # Data to search
     data = """apple
@@ -86,9 +92,7 @@ def input_with_sort() -> None:
     
     Demonstrates sorting data via stdin.
     """
-    print("\n" + "=" * 70)
-    print("INPUT WITH SORT")
-    print("=" * 70)
+    print_section("INPUT WITH SORT")
     
     # Unsorted data
     data = """zebra
@@ -120,9 +124,7 @@ def send_bytes_input() -> None:
     
     Use when working with binary data.
     """
-    print("\n" + "=" * 70)
-    print("BYTES INPUT")
-    print("=" * 70)
+    print_section("BYTES INPUT")
     
     # Bytes input
     data = b"Hello from bytes!\n"
@@ -150,9 +152,7 @@ def send_multiline_input() -> None:
     
     Useful for batch processing.
     """
-    print("\n" + "=" * 70)
-    print("MULTILINE INPUT")
-    print("=" * 70)
+    print_section("MULTILINE INPUT")
     
     # Multiple lines
     data = """Line 1
@@ -184,9 +184,7 @@ def input_from_file_content() -> None:
     
     Alternative to shell redirection.
     """
-    print("\n" + "=" * 70)
-    print("INPUT FROM FILE CONTENT")
-    print("=" * 70)
+    print_section("INPUT FROM FILE CONTENT")
     
     # Simulate file content
     file_content = """Python
@@ -219,9 +217,7 @@ def input_with_processing() -> None:
     
     Shows common data preparation patterns.
     """
-    print("\n" + "=" * 70)
-    print("INPUT WITH PROCESSING")
-    print("=" * 70)
+    print_section("INPUT WITH PROCESSING")
     
     # Original data
     numbers = [5, 2, 8, 1, 9, 3, 7, 4, 6]
@@ -246,14 +242,12 @@ def input_with_processing() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("SENDING INPUT TO PROCESSES (stdin)")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Basic input
-    print("\n" + "=" * 70)
-    print("1. BASIC INPUT")
-    print("=" * 70)
+    print_section("1. BASIC INPUT")
     send_basic_input()
     
     # With grep
@@ -274,20 +268,22 @@ if __name__ == "__main__":
     # With processing
     input_with_processing()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. input parameter sends data to stdin")
-    print("2. input can be string (text mode) or bytes")
-    print("3. Use with commands that read from stdin (cat, grep, sort)")
-    print("4. Useful for filtering and processing data")
-    print("5. Alternative to shell input redirection")
-    print("6. Multiline input: use \\n to separate lines")
-    print("7. Process data before sending (join, map, etc.)")
-    print("8. Combine with capture_output to get results")
-    print("9. Use text=True for string input/output")
-    print("10. Great for automating interactive commands")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. input parameter sends data to stdin",
+        "2. input can be string (text mode) or bytes",
+        "3. Use with commands that read from stdin (cat, grep, sort)",
+        "4. Useful for filtering and processing data",
+        "5. Alternative to shell input redirection",
+        "6. Multiline input: use \\n to separate lines",
+        "7. Process data before sending (join, map, etc.)",
+        "8. Combine with capture_output to get results",
+        "9. Use text=True for string input/output",
+        "10. Great for automating interactive commands",
+        SEPARATOR,
+    ]))
 
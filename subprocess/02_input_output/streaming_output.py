@@ -17,10 +17,21 @@ Why streaming:
 - Monitor long-running processes
 """
 
+import os
+import selectors
 import subprocess
+import threading
 import time
 from typing import Iterator, Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # NON-STREAMING (subprocess.run)
@@ -55,9 +66,7 @@ def basic_streaming() -> None:
     
     Read output line by line as it's generated.
     """
-    print("\n" + "=" * 70)
-    print("BASIC STREAMING (subprocess.Popen)")
-    print("=" * 70)
+    print_section("BASIC STREAMING (subprocess.Popen)")
     
     print("\nStreaming output:")
     
@@ -88,9 +97,7 @@ def streaming_with_progress() -> None:
     
     Useful for long-running commands.
     """
-    print("\n" + "=" * 70)
-    print("STREAMING WITH PROGRESS")
-    print("=" * 70)
+    print_section("STREAMING WITH PROGRESS")
     
     print("\nProcessing with progress:")
     
@@ -125,9 +132,7 @@ def streaming_and_filtering() -> None:
     
     Process only relevant lines.
     """
-    print("\n" + "=" * 70)
-    print("STREAMING AND FILTERING")
-    print("=" * 70)
+    print_section("STREAMING AND FILTERING")
     
     print("\nFiltering output (only errors):")
     
@@ -175,9 +180,7 @@ def streaming_with_timeout() -> None:
     
     Stop if process takes too long.
     """
-    print("\n" + "=" * 70)
-    print("STREAMING WITH TIMEOUT")
-    print("=" * 70)
+    print_section("STREAMING WITH TIMEOUT")
     
     print("\nStreaming with 3-second timeout:")
     
@@ -193,19 +196,23 @@ def streaming_with_timeout() -> None:
         text=True
     )
     
+    # The read loop blocks until the next line (or EOF), so a timeout on
+    # wait() would only be checked after the child is done. A timer kills
+    # the child once the limit passes; its stdout then hits EOF and the
+    # loop ends. The timer stays armed through wait() as well, in case the
+    # child closes stdout but keeps running.
+    timer = threading.Timer(3, process.kill)  # ← 3 second timeout
+    timer.start()
     try:
-        # Read with timeout
         if process.stdout:
             for line in process.stdout:
                 print(f"  {line.strip()}")
-        
-        # Wait with timeout
-        process.wait(timeout=3)  # ← 3 second timeout
-        
-    except subprocess.TimeoutExpired:
-        print("  ⏱️  Timeout! Killing process...")
-        process.kill()
         process.wait()
+    finally:
+        timer.cancel()
+    
+    if process.returncode < 0:  # ← Negative = killed by a signal
+        print("  ⏱️  Timeout! Process was killed")
 
 
 # ============================================================================
@@ -216,11 +223,11 @@ def streaming_both_streams() -> None:
     """
     Stream both stdout and stderr.
     
-    Note: This is simplified; real implementation needs threading.
+    Uses selectors to read whichever stream has data, so neither pipe
+    can fill up and block the child while we wait on the other one.
+    (Pipes work with selectors on POSIX only; on Windows use threads.)
     """
-    print("\n" + "=" * 70)
-    print("STREAMING STDOUT AND STDERR")
-    print("=" * 70)
+    print_section("STREAMING STDOUT AND STDERR")
     
     print("\nStreaming both streams:")
     
@@ -240,22 +247,33 @@ print('STDERR: Error 2', file=sys.stderr)
     process = subprocess.Popen(
         command,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+        stderr=subprocess.PIPE
+        # No text=True: we read raw bytes from the fds and decode ourselves
     )
     
-    # Read stdout
-    if process.stdout:
-        for line in process.stdout:
-            print(f"  OUT: {line.strip()}")
-    
+    # Watch both pipes at once
+    selector = selectors.DefaultSelector()
+    selector.register(process.stdout, selectors.EVENT_READ, "OUT")
+    selector.register(process.stderr, selectors.EVENT_READ, "ERR")
+    
+    # A read can end mid-line, so keep the partial tail per stream
+    pending = {"OUT": b"", "ERR": b""}
+    
+    while selector.get_map():  # ← Until both streams reach EOF
+        for key, _ in selector.select():
+            chunk = os.read(key.fd, 65536)  # ← Only the ready stream
+            if not chunk:
+                selector.unregister(key.fileobj)  # ← EOF on this stream
+                if pending[key.data]:
+                    print(f"  {key.data}: {pending[key.data].decode()}")  # ← Last unterminated line
+                continue
+            complete, sep, pending[key.data] = (pending[key.data] + chunk).rpartition(b"\n")
+            if sep:  # ← At least one newline arrived (even a blank line)
+                for line in complete.decode().split("\n"):  # ← Whole lines only
+                    print(f"  {key.data}: {line}")
+    
+    selector.close()
     process.wait()
-    
-    # Read stderr after completion
-    if process.stderr:
-        stderr_output = process.stderr.read()
-        if stderr_output:
-            print(f"  ERR: {stderr_output.strip()}")
 
 
 # ============================================================================
@@ -263,14 +281,12 @@ print('STDERR: Error 2', file=sys.stderr)
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("REAL-TIME OUTPUT STREAMING")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Non-streaming
-    print("\n" + "=" * 70)
-    print("1. NON-STREAMING (subprocess.run)")
-    print("=" * 70)
+    print_section("1. NON-STREAMING (subprocess.run)")
     non_streaming_example()
     
     # Basic streaming
@@ -288,20 +304,22 @@ if __name__ == "__main__":
     # Both streams
     streaming_both_streams()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. subprocess.run() waits for completion (no streaming)")
-    print("2. subprocess.Popen() enables real-time streaming")
-    print("3. Read from process.stdout line by line")
-    print("4. Use for long-running commands")
-    print("5. Show progress to users in real-time")
-    print("6. Filter output while streaming")
-    print("7. Use timeout to prevent hanging")
-    print("8. process.wait() waits for completion")
-    print("9. Streaming is more memory efficient")
-    print("10. For both streams, consider threading")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. subprocess.run() waits for completion (no streaming)",
+        "2. subprocess.Popen() enables real-time streaming",
+        "3. Read from process.stdout line by line",
+        "4. Use for long-running commands",
+        "5. Show progress to users in real-time",
+        "6. Filter output while streaming",
+        "7. Use timeout to prevent hanging",
+        "8. process.wait() waits for completion",
+        "9. Streaming is more memory efficient",
+        "10. For both streams, use selectors (or threads)",
+        SEPARATOR,
+    ]))
 
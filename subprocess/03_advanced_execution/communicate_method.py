@@ -20,6 +20,14 @@ Why communicate():
 import subprocess
 from typing import Tuple, Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BASIC COMMUNICATE
@@ -58,9 +66,7 @@ def communicate_with_input() -> None:
     
     Pass input parameter to send data to stdin.
     """
-    print("\n" + "=" * 70)
-    print("COMMUNICATE WITH INPUT")
-    print("=" * 70)
+    print_section("COMMUNICATE WITH INPUT")
     
     process = subprocess.Popen(
         ["cat"],  # cat reads from stdin
@@ -88,9 +94,7 @@ def communicate_with_grep() -> None:
     
     Common pattern for filtering data.
     """
-    print("\n" + "=" * 70)
-    print("COMMUNICATE WITH GREP")
-    print("=" * 70)
+    print_section("COMMUNICATE WITH GREP")
     
     # Data to filter
     data = """apple
@@ -127,9 +131,7 @@ def communicate_with_timeout() -> None:
     
     Prevents hanging on long-running processes.
     """
-    print("\n" + "=" * 70)
-    print("COMMUNICATE WITH TIMEOUT")
-    print("=" * 70)
+    print_section("COMMUNICATE WITH TIMEOUT")
     
     # Quick command
     print("\n1. Quick command (within timeout):")
@@ -175,9 +177,7 @@ def communicate_vs_manual_read() -> None:
     
     Shows why communicate() is preferred.
     """
-    print("\n" + "=" * 70)
-    print("COMMUNICATE VS MANUAL READ")
-    print("=" * 70)
+    print_section("COMMUNICATE VS MANUAL READ")
     
     # Using communicate() (recommended)
     print("\n1. Using communicate() (recommended):")
@@ -216,9 +216,7 @@ def communicate_return_values() -> None:
     
     Returns tuple of (stdout, stderr).
     """
-    print("\n" + "=" * 70)
-    print("COMMUNICATE RETURN VALUES")
-    print("=" * 70)
+    print_section("COMMUNICATE RETURN VALUES")
     
     # Both stdout and stderr
     print("\n1. Capturing both:")
@@ -259,14 +257,12 @@ def communicate_return_values() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("COMMUNICATE() METHOD")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Basic usage
-    print("\n" + "=" * 70)
-    print("1. BASIC COMMUNICATE")
-    print("=" * 70)
+    print_section("1. BASIC COMMUNICATE")
     basic_communicate()
     
     # With input
@@ -284,20 +280,22 @@ if __name__ == "__main__":
     # Return values
     communicate_return_values()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. communicate() sends input and reads output")
-    print("2. Returns tuple: (stdout, stderr)")
-    print("3. Waits for process to complete")
-    print("4. Prevents deadlocks automatically")
-    print("5. Use input parameter to send data to stdin")
-    print("6. Use timeout parameter to prevent hanging")
-    print("7. Preferred over manual read/write")
-    print("8. Thread-safe and handles buffering")
-    print("9. Can only be called once per process")
-    print("10. Returns None for uncaptured streams")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. communicate() sends input and reads output",
+        "2. Returns tuple: (stdout, stderr)",
+        "3. Waits for process to complete",
+        "4. Prevents deadlocks automatically",
+        "5. Use input parameter to send data to stdin",
+        "6. Use timeout parameter to prevent hanging",
+        "7. Preferred over manual read/write",
+        "8. Thread-safe and handles buffering",
+        "9. Can only be called once per process",
+        "10. Returns None for uncaptured streams",
+        SEPARATOR,
+    ]))
 
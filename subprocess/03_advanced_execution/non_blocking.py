@@ -20,6 +20,14 @@ import subprocess
 import time
 from typing import List
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BASIC NON-BLOCKING
@@ -35,11 +43,7 @@ def basic_non_blocking() -> None:
     
     # Start process
     print("Starting process...")
-    process = subprocess.Popen(
-        ["sleep", "3"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "3"])
     
     print(f"Process started (PID {process.pid})")
     print("Continuing immediately!")
@@ -65,21 +69,19 @@ def multiple_concurrent_processes() -> None:
     
     Start all processes, then wait for all.
     """
-    print("\n" + "=" * 70)
-    print("MULTIPLE CONCURRENT PROCESSES")
-    print("=" * 70)
+    print_section("MULTIPLE CONCURRENT PROCESSES")
     
     print("\nStarting 3 processes concurrently...")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Start all processes
     processes = [
-        subprocess.Popen(["sleep", "2"], stdout=subprocess.PIPE, stderr=subprocess.PIPE),
-        subprocess.Popen(["sleep", "2"], stdout=subprocess.PIPE, stderr=subprocess.PIPE),
-        subprocess.Popen(["sleep", "2"], stdout=subprocess.PIPE, stderr=subprocess.PIPE),
+        subprocess.Popen(["sleep", "2"]),
+        subprocess.Popen(["sleep", "2"]),
+        subprocess.Popen(["sleep", "2"]),
     ]
     
-    print(f"All processes started in {time.time() - start_time:.4f}s")
+    print(f"All processes started in {time.perf_counter() - start_time:.4f}s")
     
     # Wait for all to complete
     print("Waiting for all processes...")
@@ -87,7 +89,7 @@ def multiple_concurrent_processes() -> None:
         process.wait()
         print(f"  Process {i+1} finished")
     
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     print(f"\nAll processes completed in {elapsed:.2f}s")
     print("(Would take 6s if run sequentially!)")
 
@@ -102,31 +104,26 @@ def sequential_vs_concurrent() -> None:
     
     Shows performance difference.
     """
-    print("\n" + "=" * 70)
-    print("SEQUENTIAL VS CONCURRENT")
-    print("=" * 70)
+    print_section("SEQUENTIAL VS CONCURRENT")
     
     # Sequential execution
     print("\n1. Sequential execution:")
-    start = time.time()
+    start = time.perf_counter()
     
     for i in range(3):
-        result = subprocess.run(
-            ["sleep", "1"],
-            capture_output=True
-        )
+        result = subprocess.run(["sleep", "1"])
         print(f"   Process {i+1} finished")
     
-    sequential_time = time.time() - start
+    sequential_time = time.perf_counter() - start
     print(f"   Total time: {sequential_time:.2f}s")
     
     # Concurrent execution
     print("\n2. Concurrent execution:")
-    start = time.time()
+    start = time.perf_counter()
     
     # Start all
     processes = [
-        subprocess.Popen(["sleep", "1"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        subprocess.Popen(["sleep", "1"])
         for _ in range(3)
     ]
     
@@ -135,7 +132,7 @@ def sequential_vs_concurrent() -> None:
         process.wait()
         print(f"   Process {i+1} finished")
     
-    concurrent_time = time.time() - start
+    concurrent_time = time.perf_counter() - start
     print(f"   Total time: {concurrent_time:.2f}s")
     
     print(f"\n   Speedup: {sequential_time/concurrent_time:.2f}x faster!")
@@ -151,17 +148,11 @@ def work_while_waiting() -> None:
     
     Demonstrates responsive execution.
     """
-    print("\n" + "=" * 70)
-    print("WORK WHILE WAITING")
-    print("=" * 70)
+    print_section("WORK WHILE WAITING")
     
     # Start long-running process
     print("\nStarting long-running process...")
-    process = subprocess.Popen(
-        ["sleep", "5"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "5"])
     
     # Do work while it runs
     print("Doing work while process runs:")
@@ -184,9 +175,7 @@ def process_with_results() -> None:
     
     Non-blocking with result collection.
     """
-    print("\n" + "=" * 70)
-    print("PROCESS WITH RESULTS")
-    print("=" * 70)
+    print_section("PROCESS WITH RESULTS")
     
     # Commands to run
     commands = [
@@ -231,17 +220,11 @@ def early_termination() -> None:
     
     Demonstrates process control.
     """
-    print("\n" + "=" * 70)
-    print("EARLY TERMINATION")
-    print("=" * 70)
+    print_section("EARLY TERMINATION")
     
     # Start long process
     print("\nStarting long process...")
-    process = subprocess.Popen(
-        ["sleep", "10"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "10"])
     
     # Monitor and terminate early
     print("Monitoring process...")
@@ -262,14 +245,12 @@ def early_termination() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("NON-BLOCKING EXECUTION")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Basic non-blocking
-    print("\n" + "=" * 70)
-    print("1. BASIC NON-BLOCKING")
-    print("=" * 70)
+    print_section("1. BASIC NON-BLOCKING")
     basic_non_blocking()
     
     # Multiple concurrent
@@ -287,20 +268,22 @@ if __name__ == "__main__":
     # Early termination
     early_termination()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Popen returns immediately (non-blocking)")
-    print("2. Can start multiple processes concurrently")
-    print("3. Do other work while process runs")
-    print("4. Use poll() to check if still running")
-    print("5. Concurrent execution is much faster")
-    print("6. Start all processes, then wait for all")
-    print("7. Collect results with communicate()")
-    print("8. Can terminate processes early")
-    print("9. Great for parallel execution")
-    print("10. Improves application responsiveness")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Popen returns immediately (non-blocking)",
+        "2. Can start multiple processes concurrently",
+        "3. Do other work while process runs",
+        "4. Use poll() to check if still running",
+        "5. Concurrent execution is much faster",
+        "6. Start all processes, then wait for all",
+        "7. Collect results with communicate()",
+        "8. Can terminate processes early",
+        "9. Great for parallel execution",
+        "10. Improves application responsiveness",
+        SEPARATOR,
+    ]))
 
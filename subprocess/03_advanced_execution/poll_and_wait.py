@@ -19,6 +19,14 @@ import subprocess
 import time
 from typing import Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BASIC POLL
@@ -33,11 +41,7 @@ def basic_poll() -> None:
     print("Basic poll():")
     
     # Start long-running process
-    process = subprocess.Popen(
-        ["sleep", "2"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "2"])
     
     print(f"Process started, PID: {process.pid}")
     
@@ -66,16 +70,10 @@ def basic_wait() -> None:
     
     wait() blocks until process finishes.
     """
-    print("\n" + "=" * 70)
-    print("BASIC WAIT")
-    print("=" * 70)
+    print_section("BASIC WAIT")
     
     print("\nStarting process...")
-    process = subprocess.Popen(
-        ["sleep", "2"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "2"])
     
     print("Waiting for completion...")
     returncode = process.wait()  # ← Blocks until finished
@@ -94,15 +92,9 @@ def polling_loop() -> None:
     
     Allows doing other work while process runs.
     """
-    print("\n" + "=" * 70)
-    print("POLLING LOOP")
-    print("=" * 70)
+    print_section("POLLING LOOP")
     
-    process = subprocess.Popen(
-        ["sleep", "3"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "3"])
     
     print(f"\nMonitoring process {process.pid}...")
     
@@ -127,17 +119,11 @@ def wait_with_timeout() -> None:
     
     Prevents hanging on long-running processes.
     """
-    print("\n" + "=" * 70)
-    print("WAIT WITH TIMEOUT")
-    print("=" * 70)
+    print_section("WAIT WITH TIMEOUT")
     
     # Quick process (within timeout)
     print("\n1. Quick process (within timeout):")
-    process = subprocess.Popen(
-        ["sleep", "1"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "1"])
     
     try:
         returncode = process.wait(timeout=5)  # ← 5 second timeout
@@ -148,11 +134,7 @@ def wait_with_timeout() -> None:
     
     # Slow process (exceeds timeout)
     print("\n2. Slow process (exceeds timeout):")
-    process = subprocess.Popen(
-        ["sleep", "10"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "10"])
     
     try:
         returncode = process.wait(timeout=2)  # ← 2 second timeout
@@ -174,17 +156,11 @@ def poll_vs_wait() -> None:
     
     Shows the difference in behavior.
     """
-    print("\n" + "=" * 70)
-    print("POLL VS WAIT COMPARISON")
-    print("=" * 70)
+    print_section("POLL VS WAIT COMPARISON")
     
     # poll() - non-blocking
     print("\n1. poll() - non-blocking:")
-    process = subprocess.Popen(
-        ["sleep", "2"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "2"])
     
     print("   Calling poll()...")
     status = process.poll()  # ← Returns immediately
@@ -196,11 +172,7 @@ def poll_vs_wait() -> None:
     
     # wait() - blocking
     print("\n2. wait() - blocking:")
-    process = subprocess.Popen(
-        ["sleep", "2"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "2"])
     
     print("   Calling wait()...")
     returncode = process.wait()  # ← Blocks until finished
@@ -217,15 +189,13 @@ def check_multiple_processes() -> None:
     
     Monitor several processes concurrently.
     """
-    print("\n" + "=" * 70)
-    print("CHECKING MULTIPLE PROCESSES")
-    print("=" * 70)
+    print_section("CHECKING MULTIPLE PROCESSES")
     
     # Start multiple processes
     processes = [
-        subprocess.Popen(["sleep", "1"], stdout=subprocess.PIPE, stderr=subprocess.PIPE),
-        subprocess.Popen(["sleep", "2"], stdout=subprocess.PIPE, stderr=subprocess.PIPE),
-        subprocess.Popen(["sleep", "3"], stdout=subprocess.PIPE, stderr=subprocess.PIPE),
+        subprocess.Popen(["sleep", "1"]),
+        subprocess.Popen(["sleep", "2"]),
+        subprocess.Popen(["sleep", "3"]),
     ]
     
     print(f"\nStarted {len(processes)} processes")
@@ -249,14 +219,12 @@ def check_multiple_processes() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("POLL() AND WAIT() METHODS")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Basic poll
-    print("\n" + "=" * 70)
-    print("1. BASIC POLL")
-    print("=" * 70)
+    print_section("1. BASIC POLL")
     basic_poll()
     
     # Basic wait
@@ -274,20 +242,22 @@ if __name__ == "__main__":
     # Multiple processes
     check_multiple_processes()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. poll() checks status without waiting (non-blocking)")
-    print("2. wait() waits for completion (blocking)")
-    print("3. poll() returns None if running, returncode if finished")
-    print("4. wait() returns returncode after completion")
-    print("5. Use wait(timeout=N) to prevent hanging")
-    print("6. TimeoutExpired raised if timeout exceeded")
-    print("7. Use poll() in loop to monitor progress")
-    print("8. poll() allows doing other work while waiting")
-    print("9. Use poll() to check multiple processes")
-    print("10. Always call wait() or poll() to clean up")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. poll() checks status without waiting (non-blocking)",
+        "2. wait() waits for completion (blocking)",
+        "3. poll() returns None if running, returncode if finished",
+        "4. wait() returns returncode after completion",
+        "5. Use wait(timeout=N) to prevent hanging",
+        "6. TimeoutExpired raised if timeout exceeded",
+        "7. Use poll() in loop to monitor progress",
+        "8. poll() allows doing other work while waiting",
+        "9. Use poll() to check multiple processes",
+        "10. Always call wait() or poll() to clean up",
+        SEPARATOR,
+    ]))
 
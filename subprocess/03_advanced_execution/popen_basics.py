@@ -20,6 +20,14 @@ import subprocess
 import time
 from typing import Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BASIC POPEN USAGE
@@ -56,9 +64,7 @@ def popen_with_capture() -> None:
     
     Use PIPE to capture stdout/stderr.
     """
-    print("\n" + "=" * 70)
-    print("POPEN WITH OUTPUT CAPTURE")
-    print("=" * 70)
+    print_section("POPEN WITH OUTPUT CAPTURE")
     
     # Start process with output capture
     process = subprocess.Popen(
@@ -91,42 +97,33 @@ def compare_popen_vs_run() -> None:
     
     Shows the difference in behavior.
     """
-    print("\n" + "=" * 70)
-    print("POPEN VS RUN COMPARISON")
-    print("=" * 70)
+    print_section("POPEN VS RUN COMPARISON")
     
     # Using run() - waits for completion
     print("\n1. Using subprocess.run():")
     print("   Starting...")
-    start = time.time()
+    start = time.perf_counter()
     
-    result = subprocess.run(
-        ["sleep", "1"],
-        capture_output=True
-    )
+    result = subprocess.run(["sleep", "1"])
     
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     print(f"   Completed in {elapsed:.2f} seconds")
     print(f"   Return code: {result.returncode}")
     
     # Using Popen - returns immediately
     print("\n2. Using subprocess.Popen():")
     print("   Starting...")
-    start = time.time()
+    start = time.perf_counter()
     
-    process = subprocess.Popen(
-        ["sleep", "1"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "1"])
     
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     print(f"   Popen returned in {elapsed:.4f} seconds")
     print(f"   Process is running in background...")
     
     # Wait for completion
     process.wait()
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     print(f"   Process completed in {elapsed:.2f} seconds")
     print(f"   Return code: {process.returncode}")
 
@@ -141,9 +138,7 @@ def popen_attributes() -> None:
     
     Shows available attributes and methods.
     """
-    print("\n" + "=" * 70)
-    print("POPEN ATTRIBUTES")
-    print("=" * 70)
+    print_section("POPEN ATTRIBUTES")
     
     process = subprocess.Popen(
         ["echo", "Hello"],
@@ -176,9 +171,7 @@ def when_to_use_popen() -> None:
     """
     When to use Popen vs run().
     """
-    print("\n" + "=" * 70)
-    print("WHEN TO USE POPEN")
-    print("=" * 70)
+    print_section("WHEN TO USE POPEN")
     
     print("\n✅ Use subprocess.run() when:")
     print("   - Simple command execution")
@@ -200,14 +193,12 @@ def when_to_use_popen() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("SUBPROCESS.POPEN BASICS")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Basic usage
-    print("\n" + "=" * 70)
-    print("1. BASIC POPEN USAGE")
-    print("=" * 70)
+    print_section("1. BASIC POPEN USAGE")
     basic_popen()
     
     # With capture
@@ -222,20 +213,22 @@ if __name__ == "__main__":
     # When to use
     when_to_use_popen()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Popen is the low-level subprocess interface")
-    print("2. subprocess.run() is built on top of Popen")
-    print("3. Popen returns immediately (non-blocking)")
-    print("4. Use wait() to wait for process completion")
-    print("5. Access process.pid for process ID")
-    print("6. process.returncode is None until finished")
-    print("7. Use PIPE to capture stdout/stderr")
-    print("8. Use run() for simple cases, Popen for control")
-    print("9. Popen allows real-time streaming")
-    print("10. Must manage process lifecycle manually")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Popen is the low-level subprocess interface",
+        "2. subprocess.run() is built on top of Popen",
+        "3. Popen returns immediately (non-blocking)",
+        "4. Use wait() to wait for process completion",
+        "5. Access process.pid for process ID",
+        "6. process.returncode is None until finished",
+        "7. Use PIPE to capture stdout/stderr",
+        "8. Use run() for simple cases, Popen for control",
+        "9. Popen allows real-time streaming",
+        "10. Must manage process lifecycle manually",
+        SEPARATOR,
+    ]))
 
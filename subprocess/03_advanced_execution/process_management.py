@@ -20,6 +20,14 @@ import time
 import signal
 from typing import List, Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # PROCESS ATTRIBUTES
@@ -33,11 +41,7 @@ def process_attributes() -> None:
     """
     print("Process attributes:")
     
-    process = subprocess.Popen(
-        ["sleep", "5"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "5"])
     
     print(f"\nWhile running:")
     print(f"  pid: {process.pid}")  # Process ID
@@ -63,17 +67,11 @@ def terminating_processes() -> None:
     
     terminate() vs kill().
     """
-    print("\n" + "=" * 70)
-    print("TERMINATING PROCESSES")
-    print("=" * 70)
+    print_section("TERMINATING PROCESSES")
     
     # Using terminate() (graceful)
     print("\n1. Using terminate() (graceful):")
-    process = subprocess.Popen(
-        ["sleep", "10"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "10"])
     
     print(f"   Started process {process.pid}")
     time.sleep(1)
@@ -84,11 +82,7 @@ def terminating_processes() -> None:
     
     # Using kill() (forceful)
     print("\n2. Using kill() (forceful):")
-    process = subprocess.Popen(
-        ["sleep", "10"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "10"])
     
     print(f"   Started process {process.pid}")
     time.sleep(1)
@@ -108,15 +102,9 @@ def sending_signals() -> None:
     
     Use send_signal() for specific signals.
     """
-    print("\n" + "=" * 70)
-    print("SENDING SIGNALS")
-    print("=" * 70)
+    print_section("SENDING SIGNALS")
     
-    process = subprocess.Popen(
-        ["sleep", "10"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "10"])
     
     print(f"\nStarted process {process.pid}")
     time.sleep(1)
@@ -139,18 +127,12 @@ def process_cleanup() -> None:
     
     Always clean up resources.
     """
-    print("\n" + "=" * 70)
-    print("PROCESS CLEANUP")
-    print("=" * 70)
+    print_section("PROCESS CLEANUP")
     
     # Using context manager (recommended)
     print("\n1. Using context manager (recommended):")
     
-    with subprocess.Popen(
-        ["sleep", "2"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    ) as process:
+    with subprocess.Popen(["sleep", "2"]) as process:
         print(f"   Process started: {process.pid}")
         process.wait()
         print(f"   Process finished: {process.returncode}")
@@ -159,11 +141,7 @@ def process_cleanup() -> None:
     
     # Manual cleanup
     print("\n2. Manual cleanup:")
-    process = subprocess.Popen(
-        ["sleep", "2"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "2"])
     
     try:
         print(f"   Process started: {process.pid}")
@@ -187,19 +165,13 @@ def managing_multiple_processes() -> None:
     
     Track and control several processes.
     """
-    print("\n" + "=" * 70)
-    print("MANAGING MULTIPLE PROCESSES")
-    print("=" * 70)
+    print_section("MANAGING MULTIPLE PROCESSES")
     
     # Start multiple processes
     print("\nStarting processes...")
     processes = []
     for i in range(3):
-        p = subprocess.Popen(
-            ["sleep", str(i + 1)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        p = subprocess.Popen(["sleep", str(i + 1)])
         processes.append(p)
         print(f"  Started process {i+1} (PID {p.pid})")
     
@@ -227,15 +199,9 @@ def process_timeout_cleanup() -> None:
     
     Ensure resources are freed on timeout.
     """
-    print("\n" + "=" * 70)
-    print("PROCESS TIMEOUT AND CLEANUP")
-    print("=" * 70)
+    print_section("PROCESS TIMEOUT AND CLEANUP")
     
-    process = subprocess.Popen(
-        ["sleep", "10"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "10"])
     
     print(f"\nStarted process {process.pid}")
     print("Waiting with 2-second timeout...")
@@ -260,15 +226,9 @@ def checking_process_state() -> None:
     
     Understand process lifecycle.
     """
-    print("\n" + "=" * 70)
-    print("CHECKING PROCESS STATE")
-    print("=" * 70)
+    print_section("CHECKING PROCESS STATE")
     
-    process = subprocess.Popen(
-        ["sleep", "2"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "2"])
     
     # State 1: Running
     print(f"\n1. Running:")
@@ -284,11 +244,7 @@ def checking_process_state() -> None:
     print(f"   returncode: {process.returncode}")
     
     # State 3: Terminated
-    process = subprocess.Popen(
-        ["sleep", "10"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    process = subprocess.Popen(["sleep", "10"])
     process.terminate()
     process.wait()
     
@@ -302,14 +258,12 @@ def checking_process_state() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("PROCESS MANAGEMENT")
-    print("=" * 70)
+    print(SEPARATOR)
     
     # Attributes
-    print("\n" + "=" * 70)
-    print("1. PROCESS ATTRIBUTES")
-    print("=" * 70)
+    print_section("1. PROCESS ATTRIBUTES")
     process_attributes()
     
     # Terminating
@@ -330,20 +284,22 @@ if __name__ == "__main__":
     # Process state
     checking_process_state()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Access process.pid for process ID")
-    print("2. process.returncode is None while running")
-    print("3. terminate() sends SIGTERM (graceful)")
-    print("4. kill() sends SIGKILL (forceful)")
-    print("5. send_signal() for custom signals")
-    print("6. Use context manager for automatic cleanup")
-    print("7. Always clean up resources (wait/terminate)")
-    print("8. Handle timeouts with proper cleanup")
-    print("9. Monitor multiple processes with poll()")
-    print("10. Check process state with poll() and returncode")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Access process.pid for process ID",
+        "2. process.returncode is None while running",
+        "3. terminate() sends SIGTERM (graceful)",
+        "4. kill() sends SIGKILL (forceful)",
+        "5. send_signal() for custom signals",
+        "6. Use context manager for automatic cleanup",
+        "7. Always clean up resources (wait/terminate)",
+        "8. Handle timeouts with proper cleanup",
+        "9. Monitor multiple processes with poll()",
+        "10. Check process state with poll() and returncode",
+        SEPARATOR,
+    ]))
 
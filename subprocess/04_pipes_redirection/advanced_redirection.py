@@ -16,11 +16,20 @@ Advanced patterns:
 - Logging and monitoring
 """
 
+import shlex
 import subprocess
 import tempfile
 import os
 from typing import Optional, TextIO
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BIDIRECTIONAL COMMUNICATION
@@ -66,9 +75,7 @@ def tee_like_behavior() -> None:
     
     Like Unix 'tee' command: write to file AND stdout.
     """
-    print("\n" + "=" * 70)
-    print("TEE-LIKE BEHAVIOR")
-    print("=" * 70)
+    print_section("TEE-LIKE BEHAVIOR")
     
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
         output_file = f.name
@@ -106,9 +113,7 @@ def conditional_redirection() -> None:
     
     Different redirection based on success/failure.
     """
-    print("\n" + "=" * 70)
-    print("CONDITIONAL REDIRECTION")
-    print("=" * 70)
+    print_section("CONDITIONAL REDIRECTION")
     
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
         success_file = f.name
@@ -154,9 +159,7 @@ def logging_wrapper() -> None:
     
     Log all input/output to file.
     """
-    print("\n" + "=" * 70)
-    print("LOGGING WRAPPER")
-    print("=" * 70)
+    print_section("LOGGING WRAPPER")
     
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.log') as f:
         log_file = f.name
@@ -166,19 +169,19 @@ def logging_wrapper() -> None:
         with open(log_file, 'w') as log:
             # Log command
             command = ["echo", "Test command"]
-            log.write(f"Command: {' '.join(command)}\n")
+            log.write(f"Command: {shlex.join(command)}\n")  # ← Quoted like a shell
             log.write("-" * 40 + "\n")
+            log.write("output:\n")
+            log.flush()  # ← Header must hit the file before the child writes
             
-            # Run command
+            # Run command (child writes straight into the log file)
             result = subprocess.run(
                 command,
-                capture_output=True,
-                text=True
+                stdout=log,
+                stderr=subprocess.STDOUT
             )
             
-            # Log output
-            log.write(f"stdout:\n{result.stdout}")
-            log.write(f"stderr:\n{result.stderr}")
+            # Log return code
             log.write(f"Return code: {result.returncode}\n")
         
         # Show log
@@ -199,9 +202,7 @@ def multiple_input_sources() -> None:
     
     Merge data from different sources.
     """
-    print("\n" + "=" * 70)
-    print("MULTIPLE INPUT SOURCES")
-    print("=" * 70)
+    print_section("MULTIPLE INPUT SOURCES")
     
     # Create temp files
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
@@ -237,9 +238,7 @@ def dynamic_redirection() -> None:
 
     Redirect based on runtime conditions.
     """
-    print("\n" + "=" * 70)
-    print("DYNAMIC REDIRECTION")
-    print("=" * 70)
+    print_section("DYNAMIC REDIRECTION")
 
     # Condition
     verbose = True
@@ -275,9 +274,7 @@ def pipeline_with_checkpoints() -> None:
 
     Checkpoint data at each stage.
     """
-    print("\n" + "=" * 70)
-    print("PIPELINE WITH CHECKPOINTS")
-    print("=" * 70)
+    print_section("PIPELINE WITH CHECKPOINTS")
 
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='_stage1.txt') as f:
         stage1_file = f.name
@@ -336,14 +333,12 @@ def pipeline_with_checkpoints() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("ADVANCED REDIRECTION")
-    print("=" * 70)
+    print(SEPARATOR)
 
     # Bidirectional
-    print("\n" + "=" * 70)
-    print("1. BIDIRECTIONAL COMMUNICATION")
-    print("=" * 70)
+    print_section("1. BIDIRECTIONAL COMMUNICATION")
     bidirectional_communication()
 
     # Tee-like
@@ -364,20 +359,22 @@ if __name__ == "__main__":
     # Checkpoints
     pipeline_with_checkpoints()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Bidirectional communication with stdin/stdout")
-    print("2. Split output to multiple destinations (tee)")
-    print("3. Conditional redirection based on results")
-    print("4. Wrap commands with logging")
-    print("5. Combine input from multiple sources")
-    print("6. Dynamic redirection based on conditions")
-    print("7. Save pipeline checkpoints for debugging")
-    print("8. Use file handles for flexible redirection")
-    print("9. Context managers ensure proper cleanup")
-    print("10. Advanced patterns enable complex workflows")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Bidirectional communication with stdin/stdout",
+        "2. Split output to multiple destinations (tee)",
+        "3. Conditional redirection based on results",
+        "4. Wrap commands with logging",
+        "5. Combine input from multiple sources",
+        "6. Dynamic redirection based on conditions",
+        "7. Save pipeline checkpoints for debugging",
+        "8. Use file handles for flexible redirection",
+        "9. Context managers ensure proper cleanup",
+        "10. Advanced patterns enable complex workflows",
+        SEPARATOR,
+    ]))
 
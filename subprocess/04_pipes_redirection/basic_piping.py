@@ -16,8 +16,17 @@ What is a pipe?
 """
 
 import subprocess
+import textwrap
 from typing import Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # BASIC PIPE
@@ -64,9 +73,7 @@ def pipe_with_text_mode() -> None:
     
     Equivalent to: echo "Line 1\nLine 2\nLine 3" | wc -l
     """
-    print("\n" + "=" * 70)
-    print("PIPE WITH TEXT MODE")
-    print("=" * 70)
+    print_section("PIPE WITH TEXT MODE")
     
     # First process
     p1 = subprocess.Popen(
@@ -101,9 +108,7 @@ def multiple_pipes() -> None:
     
     Equivalent to: echo "apple\nbanana\napple" | sort | uniq
     """
-    print("\n" + "=" * 70)
-    print("MULTIPLE PIPES")
-    print("=" * 70)
+    print_section("MULTIPLE PIPES")
     
     # Process 1: echo
     p1 = subprocess.Popen(
@@ -148,9 +153,7 @@ def pipe_with_error_handling() -> None:
     
     Check return codes of all processes.
     """
-    print("\n" + "=" * 70)
-    print("PIPE WITH ERROR HANDLING")
-    print("=" * 70)
+    print_section("PIPE WITH ERROR HANDLING")
     
     # First process
     p1 = subprocess.Popen(
@@ -189,9 +192,7 @@ def reading_pipe_output() -> None:
 
     Process data as it flows through the pipe.
     """
-    print("\n" + "=" * 70)
-    print("READING PIPE OUTPUT")
-    print("=" * 70)
+    print_section("READING PIPE OUTPUT")
 
     # Generate data
     p1 = subprocess.Popen(
@@ -214,8 +215,7 @@ def reading_pipe_output() -> None:
     output, _ = p2.communicate()
 
     print("Lines containing 'a':")
-    for line in output.strip().split('\n'):
-        print(f"  - {line}")
+    print(textwrap.indent(output.strip(), "  - ", predicate=lambda _: True))
 
 
 # ============================================================================
@@ -228,9 +228,7 @@ def pipe_with_custom_data() -> None:
 
     Send your own data through a pipeline.
     """
-    print("\n" + "=" * 70)
-    print("PIPE WITH CUSTOM DATA")
-    print("=" * 70)
+    print_section("PIPE WITH CUSTOM DATA")
 
     # Custom data
     data = "apple\nbanana\napple\ncherry\nbanana\napple\n"
@@ -271,14 +269,12 @@ def pipe_with_custom_data() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("BASIC PIPING")
-    print("=" * 70)
+    print(SEPARATOR)
 
     # Basic pipe
-    print("\n" + "=" * 70)
-    print("1. BASIC PIPE")
-    print("=" * 70)
+    print_section("1. BASIC PIPE")
     basic_pipe()
 
     # Text mode
@@ -296,20 +292,22 @@ if __name__ == "__main__":
     # Custom data
     pipe_with_custom_data()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Use subprocess.PIPE to connect processes")
-    print("2. Set stdin of p2 to stdout of p1")
-    print("3. Close p1.stdout after connecting to p2")
-    print("4. Use text=True for easier string handling")
-    print("5. Chain multiple processes for complex pipelines")
-    print("6. Check return codes of all processes")
-    print("7. Use communicate() to get final output")
-    print("8. Pipes work like shell: cmd1 | cmd2")
-    print("9. Can send custom data through pipelines")
-    print("10. Always handle errors in piped processes")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Use subprocess.PIPE to connect processes",
+        "2. Set stdin of p2 to stdout of p1",
+        "3. Close p1.stdout after connecting to p2",
+        "4. Use text=True for easier string handling",
+        "5. Chain multiple processes for complex pipelines",
+        "6. Check return codes of all processes",
+        "7. Use communicate() to get final output",
+        "8. Pipes work like shell: cmd1 | cmd2",
+        "9. Can send custom data through pipelines",
+        "10. Always handle errors in piped processes",
+        SEPARATOR,
+    ]))
 
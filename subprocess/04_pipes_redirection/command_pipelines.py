@@ -20,7 +20,17 @@ Benefits:
 """
 
 import subprocess
-from typing import List, Optional, Tuple
+import textwrap
+import threading
+from typing import IO, List, Optional, Tuple
+
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
 
 
 # ============================================================================
@@ -88,9 +98,7 @@ def pipeline_with_data_processing() -> None:
     
     Equivalent to: cat file | grep pattern | sort | head -n 5
     """
-    print("\n" + "=" * 70)
-    print("PIPELINE WITH DATA PROCESSING")
-    print("=" * 70)
+    print_section("PIPELINE WITH DATA PROCESSING")
     
     # Generate sample data
     data = "apple\nbanana\napricot\navocado\nblueberry\ncherry\n"
@@ -140,6 +148,18 @@ def pipeline_with_data_processing() -> None:
 # PIPELINE BUILDER
 # ============================================================================
 
+def _feed_stdin(stdin: IO[str], data: str) -> None:
+    """Write data to a pipeline's stdin and close it (runs in a thread)."""
+    try:
+        stdin.write(data)
+    except BrokenPipeError:
+        pass  # ← First stage exited early (e.g. head), like communicate()
+    try:
+        stdin.close()
+    except BrokenPipeError:
+        pass
+
+
 def build_pipeline(commands: List[List[str]], input_data: Optional[str] = None) -> str:
     """
     Build a pipeline from a list of commands.
@@ -177,13 +197,22 @@ def build_pipeline(commands: List[List[str]], input_data: Optional[str] = None)
         if prev_process.stdout:
             prev_process.stdout.close()
     
-    # Send input data if provided
+    # Single command: communicate() feeds stdin and reads stdout together
+    if len(processes) == 1:
+        output, _ = first_process.communicate(input_data)
+        return output
+    
+    # Send input data if provided (from a thread, so a large input cannot
+    # fill the pipes and deadlock while nobody reads the last stage yet)
+    writer = None
     if input_data and first_process.stdin:
-        first_process.stdin.write(input_data)
-        first_process.stdin.close()
+        writer = threading.Thread(target=_feed_stdin, args=(first_process.stdin, input_data))
+        writer.start()
     
     # Get output from last process
     output, _ = processes[-1].communicate()
+    if writer:
+        writer.join()
 
     return output
 
@@ -194,9 +223,7 @@ def use_pipeline_builder() -> None:
 
     Demonstrates reusable pipeline construction.
     """
-    print("\n" + "=" * 70)
-    print("PIPELINE BUILDER")
-    print("=" * 70)
+    print_section("PIPELINE BUILDER")
 
     # Example 1: Sort and count
     print("\n1. Sort and count unique items:")
@@ -218,8 +245,7 @@ def use_pipeline_builder() -> None:
     data = "apple\nbanana\ncherry\navocado\n"
     result = build_pipeline(commands, data)
     print("   Filtered and sorted:")
-    for line in result.strip().split('\n'):
-        print(f"     - {line}")
+    print(textwrap.indent(result.strip(), "     - ", predicate=lambda _: True))
 
 
 # ============================================================================
@@ -232,9 +258,7 @@ def pipeline_with_error_handling() -> None:
 
     Check each stage for errors.
     """
-    print("\n" + "=" * 70)
-    print("PIPELINE WITH ERROR HANDLING")
-    print("=" * 70)
+    print_section("PIPELINE WITH ERROR HANDLING")
 
     # Stage 1
     p1 = subprocess.Popen(
@@ -279,9 +303,7 @@ def complex_pipeline_example() -> None:
 
     Process log data: filter → sort → count → format
     """
-    print("\n" + "=" * 70)
-    print("COMPLEX PIPELINE EXAMPLE")
-    print("=" * 70)
+    print_section("COMPLEX PIPELINE EXAMPLE")
 
     # Sample log data
     log_data = """ERROR: Connection failed
@@ -345,9 +367,7 @@ def parallel_pipelines() -> None:
 
     Process different data streams concurrently.
     """
-    print("\n" + "=" * 70)
-    print("PARALLEL PIPELINES")
-    print("=" * 70)
+    print_section("PARALLEL PIPELINES")
 
     # Pipeline 1: Count words
     commands1 = [
@@ -389,14 +409,12 @@ def parallel_pipelines() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("COMMAND PIPELINES")
-    print("=" * 70)
+    print(SEPARATOR)
 
     # Three-stage
-    print("\n" + "=" * 70)
-    print("1. THREE-STAGE PIPELINE")
-    print("=" * 70)
+    print_section("1. THREE-STAGE PIPELINE")
     three_stage_pipeline()
 
     # Data processing
@@ -414,20 +432,22 @@ if __name__ == "__main__":
     # Parallel
     parallel_pipelines()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Chain multiple processes for complex tasks")
-    print("2. Close stdout after connecting to next process")
-    print("3. Build reusable pipeline functions")
-    print("4. Check return codes of all stages")
-    print("5. Use text=True for string processing")
-    print("6. Handle errors at each stage")
-    print("7. Pipelines break complex tasks into simple steps")
-    print("8. Can run multiple pipelines in parallel")
-    print("9. Always wait for all processes to complete")
-    print("10. Pipeline pattern: data → p1 → p2 → p3 → result")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Chain multiple processes for complex tasks",
+        "2. Close stdout after connecting to next process",
+        "3. Build reusable pipeline functions",
+        "4. Check return codes of all stages",
+        "5. Use text=True for string processing",
+        "6. Handle errors at each stage",
+        "7. Pipelines break complex tasks into simple steps",
+        "8. Can run multiple pipelines in parallel",
+        "9. Always wait for all processes to complete",
+        "10. Pipeline pattern: data → p1 → p2 → p3 → result",
+        SEPARATOR,
+    ]))
 
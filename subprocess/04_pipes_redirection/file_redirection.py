@@ -21,6 +21,14 @@ import os
 import tempfile
 from typing import Optional
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # REDIRECT STDOUT TO FILE
@@ -34,25 +42,18 @@ def redirect_stdout_to_file() -> None:
     """
     print("Redirect stdout to file:")
     
-    # Create temp file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        output_file = f.name
-    
-    try:
-        # Open file for writing
-        with open(output_file, 'w') as f:
-            subprocess.run(
-                ["echo", "Hello World"],
-                stdout=f  # ← Redirect stdout to file
-            )
-        
-        # Read the file
-        with open(output_file, 'r') as f:
-            content = f.read()
+    # Temp file opened for writing and reading (removed on close)
+    with tempfile.TemporaryFile(mode='w+') as f:
+        subprocess.run(
+            ["echo", "Hello World"],
+            stdout=f  # ← Redirect stdout to file
+        )
         
-        print(f"File content: {content.strip()}")
-    finally:
-        os.unlink(output_file)
+        # Rewind and read what the child wrote
+        f.seek(0)
+        content = f.read()
+    
+    print(f"File content: {content.strip()}")
 
 
 # ============================================================================
@@ -65,32 +66,24 @@ def redirect_stderr_to_file() -> None:
     
     Capture error messages separately.
     """
-    print("\n" + "=" * 70)
-    print("REDIRECT STDERR TO FILE")
-    print("=" * 70)
-    
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        error_file = f.name
+    print_section("REDIRECT STDERR TO FILE")
     
-    try:
+    with tempfile.TemporaryFile(mode='w+') as f:
         # Command that produces error
-        with open(error_file, 'w') as f:
-            result = subprocess.run(
-                ["ls", "/nonexistent"],
-                stderr=f,  # ← Redirect stderr to file
-                stdout=subprocess.PIPE
-            )
+        result = subprocess.run(
+            ["ls", "/nonexistent"],
+            stderr=f,  # ← Redirect stderr to file
+            stdout=subprocess.PIPE
+        )
         
         # Read error file
-        with open(error_file, 'r') as f:
-            errors = f.read()
-        
-        print(f"Return code: {result.returncode}")
-        print(f"Errors written to file: {bool(errors)}")
-        if errors:
-            print(f"Error content: {errors.strip()}")
-    finally:
-        os.unlink(error_file)
+        f.seek(0)
+        errors = f.read()
+    
+    print(f"Return code: {result.returncode}")
+    print(f"Errors written to file: {bool(errors)}")
+    if errors:
+        print(f"Error content: {errors.strip()}")
 
 
 # ============================================================================
@@ -103,28 +96,21 @@ def redirect_stdin_from_file() -> None:
     
     Equivalent to: wc -l < input.txt
     """
-    print("\n" + "=" * 70)
-    print("REDIRECT STDIN FROM FILE")
-    print("=" * 70)
+    print_section("REDIRECT STDIN FROM FILE")
     
-    # Create input file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        input_file = f.name
+    # Create input file (read/write, removed automatically on close)
+    with tempfile.TemporaryFile(mode='w+') as f:
         f.write("Line 1\nLine 2\nLine 3\n")
-    
-    try:
-        # Open file for reading
-        with open(input_file, 'r') as f:
-            result = subprocess.run(
-                ["wc", "-l"],
-                stdin=f,  # ← Read stdin from file
-                capture_output=True,
-                text=True
-            )
+        f.seek(0)  # ← Flush and rewind so the child reads from the start
         
-        print(f"Line count: {result.stdout.strip()}")
-    finally:
-        os.unlink(input_file)
+        result = subprocess.run(
+            ["wc", "-l"],
+            stdin=f,  # ← Read stdin from file
+            capture_output=True,
+            text=True
+        )
+    
+    print(f"Line count: {result.stdout.strip()}")
 
 
 # ============================================================================
@@ -137,9 +123,7 @@ def append_to_file() -> None:
     
     Equivalent to: echo "text" >> file.txt
     """
-    print("\n" + "=" * 70)
-    print("APPEND TO FILE")
-    print("=" * 70)
+    print_section("APPEND TO FILE")
     
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
         output_file = f.name
@@ -174,37 +158,26 @@ def redirect_both_streams() -> None:
     
     Separate output and errors.
     """
-    print("\n" + "=" * 70)
-    print("REDIRECT BOTH STREAMS")
-    print("=" * 70)
-    
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        stdout_file = f.name
+    print_section("REDIRECT BOTH STREAMS")
     
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        stderr_file = f.name
-    
-    try:
+    with tempfile.TemporaryFile(mode='w+') as out_f, \
+            tempfile.TemporaryFile(mode='w+') as err_f:
         # Run command with both redirections
-        with open(stdout_file, 'w') as out_f, open(stderr_file, 'w') as err_f:
-            subprocess.run(
-                ["sh", "-c", "echo 'output' && echo 'error' >&2"],
-                stdout=out_f,  # ← Redirect stdout
-                stderr=err_f   # ← Redirect stderr
-            )
+        subprocess.run(
+            ["sh", "-c", "echo 'output' && echo 'error' >&2"],
+            stdout=out_f,  # ← Redirect stdout
+            stderr=err_f   # ← Redirect stderr
+        )
         
-        # Read both files
-        with open(stdout_file, 'r') as f:
-            stdout_content = f.read()
+        # Rewind and read both files
+        out_f.seek(0)
+        stdout_content = out_f.read()
         
-        with open(stderr_file, 'r') as f:
-            stderr_content = f.read()
-        
-        print(f"Stdout: {stdout_content.strip()}")
-        print(f"Stderr: {stderr_content.strip()}")
-    finally:
-        os.unlink(stdout_file)
-        os.unlink(stderr_file)
+        err_f.seek(0)
+        stderr_content = err_f.read()
+    
+    print(f"Stdout: {stdout_content.strip()}")
+    print(f"Stderr: {stderr_content.strip()}")
 
 
 # ============================================================================
@@ -217,9 +190,7 @@ def redirect_to_devnull() -> None:
 
     Suppress unwanted output.
     """
-    print("\n" + "=" * 70)
-    print("REDIRECT TO DEVNULL")
-    print("=" * 70)
+    print_section("REDIRECT TO DEVNULL")
 
     # Suppress stdout
     print("1. Suppress stdout:")
@@ -257,33 +228,24 @@ def file_redirection_with_popen() -> None:
 
     More control over file handling.
     """
-    print("\n" + "=" * 70)
-    print("FILE REDIRECTION WITH POPEN")
-    print("=" * 70)
+    print_section("FILE REDIRECTION WITH POPEN")
 
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        output_file = f.name
-
-    try:
-        # Open file
-        with open(output_file, 'w') as f:
-            # Start process with file redirection
-            process = subprocess.Popen(
-                ["echo", "Hello from Popen"],
-                stdout=f
-            )
+    with tempfile.TemporaryFile(mode='w+') as f:
+        # Start process with file redirection
+        process = subprocess.Popen(
+            ["echo", "Hello from Popen"],
+            stdout=f
+        )
 
-            # Wait for completion
-            process.wait()
+        # Wait for completion
+        process.wait()
 
         # Read result
-        with open(output_file, 'r') as f:
-            content = f.read()
+        f.seek(0)
+        content = f.read()
 
-        print(f"File content: {content.strip()}")
-        print(f"Return code: {process.returncode}")
-    finally:
-        os.unlink(output_file)
+    print(f"File content: {content.strip()}")
+    print(f"Return code: {process.returncode}")
 
 
 # ============================================================================
@@ -291,14 +253,12 @@ def file_redirection_with_popen() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("FILE REDIRECTION")
-    print("=" * 70)
+    print(SEPARATOR)
 
     # Redirect stdout
-    print("\n" + "=" * 70)
-    print("1. REDIRECT STDOUT TO FILE")
-    print("=" * 70)
+    print_section("1. REDIRECT STDOUT TO FILE")
     redirect_stdout_to_file()
 
     # Redirect stderr
@@ -319,20 +279,22 @@ if __name__ == "__main__":
     # With Popen
     file_redirection_with_popen()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. Use file handle for stdout/stderr/stdin")
-    print("2. Open file with 'w' to write, 'a' to append")
-    print("3. Open file with 'r' for stdin input")
-    print("4. subprocess.DEVNULL discards output")
-    print("5. Can redirect stdout and stderr separately")
-    print("6. Use context managers for file handling")
-    print("7. Works with both run() and Popen()")
-    print("8. Always close files properly")
-    print("9. Use tempfile for temporary files")
-    print("10. Check return codes even with redirection")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. Use file handle for stdout/stderr/stdin",
+        "2. Open file with 'w' to write, 'a' to append",
+        "3. Pass a readable file handle as stdin (seek(0) after writing it)",
+        "4. subprocess.DEVNULL discards output",
+        "5. Can redirect stdout and stderr separately",
+        "6. Use context managers for file handling",
+        "7. Works with both run() and Popen()",
+        "8. Always close files properly",
+        "9. Use tempfile for temporary files",
+        "10. Check return codes even with redirection",
+        SEPARATOR,
+    ]))
 
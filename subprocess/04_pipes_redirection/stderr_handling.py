@@ -17,9 +17,19 @@ stderr uses:
 - Progress information
 """
 
+import os
+import selectors
 import subprocess
 from typing import Tuple
 
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+def print_section(title: str) -> None:
+    """Print a section header framed by separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 # ============================================================================
 # SEPARATE STDOUT AND STDERR
@@ -54,9 +64,7 @@ def combine_stdout_stderr() -> None:
     
     Equivalent to: command 2>&1
     """
-    print("\n" + "=" * 70)
-    print("COMBINE STDOUT AND STDERR")
-    print("=" * 70)
+    print_section("COMBINE STDOUT AND STDERR")
     
     result = subprocess.run(
         ["sh", "-c", "echo 'output' && echo 'error' >&2"],
@@ -79,9 +87,7 @@ def redirect_stderr_in_pipe() -> None:
     
     Process both streams together.
     """
-    print("\n" + "=" * 70)
-    print("REDIRECT STDERR IN PIPE")
-    print("=" * 70)
+    print_section("REDIRECT STDERR IN PIPE")
     
     # First process with combined output
     p1 = subprocess.Popen(
@@ -118,9 +124,7 @@ def suppress_stderr() -> None:
     
     Discard error messages.
     """
-    print("\n" + "=" * 70)
-    print("SUPPRESS STDERR")
-    print("=" * 70)
+    print_section("SUPPRESS STDERR")
     
     # Command that produces error
     print("Running command that produces error...")
@@ -146,9 +150,7 @@ def process_stderr_separately() -> None:
     
     Handle errors differently.
     """
-    print("\n" + "=" * 70)
-    print("PROCESS STDERR SEPARATELY")
-    print("=" * 70)
+    print_section("PROCESS STDERR SEPARATELY")
     
     result = subprocess.run(
         ["sh", "-c", "echo 'Success' && echo 'Warning: low memory' >&2"],
@@ -177,16 +179,13 @@ def stderr_in_pipeline() -> None:
     
     Each stage can have its own errors.
     """
-    print("\n" + "=" * 70)
-    print("STDERR IN PIPELINE")
-    print("=" * 70)
+    print_section("STDERR IN PIPELINE")
     
     # Stage 1
     p1 = subprocess.Popen(
         ["sh", "-c", "echo 'data' && echo 'warning from p1' >&2"],
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+        stderr=subprocess.PIPE
     )
     
     # Stage 2
@@ -194,23 +193,35 @@ def stderr_in_pipeline() -> None:
         ["cat"],
         stdin=p1.stdout,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+        stderr=subprocess.PIPE
     )
     
     if p1.stdout:
         p1.stdout.close()
     
-    # Get outputs
-    p2_out, p2_err = p2.communicate()
-    p1.wait()
+    # Drain all three pipes together: reading p2 to the end first could
+    # deadlock if p1 filled its stderr pipe in the meantime (POSIX only)
+    outputs = {"p1_err": b"", "p2_out": b"", "p2_err": b""}
+    selector = selectors.DefaultSelector()
+    selector.register(p1.stderr, selectors.EVENT_READ, "p1_err")
+    selector.register(p2.stdout, selectors.EVENT_READ, "p2_out")
+    selector.register(p2.stderr, selectors.EVENT_READ, "p2_err")
     
-    # Get p1 stderr
-    p1_err = p1.stderr.read() if p1.stderr else ""
+    while selector.get_map():  # ← Until every stream reaches EOF
+        for key, _ in selector.select():
+            chunk = os.read(key.fd, 65536)
+            if not chunk:
+                selector.unregister(key.fileobj)  # ← EOF on this stream
+                continue
+            outputs[key.data] += chunk
+    selector.close()
+    
+    p1.wait()
+    p2.wait()
     
-    print(f"Stage 1 stderr: {p1_err.strip()}")
-    print(f"Stage 2 stdout: {p2_out.strip()}")
-    print(f"Stage 2 stderr: {p2_err.strip()}")
+    print(f"Stage 1 stderr: {outputs['p1_err'].decode().strip()}")
+    print(f"Stage 2 stdout: {outputs['p2_out'].decode().strip()}")
+    print(f"Stage 2 stderr: {outputs['p2_err'].decode().strip()}")
 
 
 # ============================================================================
@@ -223,9 +234,7 @@ def check_stderr_for_errors() -> None:
 
     Use stderr content to determine success.
     """
-    print("\n" + "=" * 70)
-    print("CHECK STDERR FOR ERRORS")
-    print("=" * 70)
+    print_section("CHECK STDERR FOR ERRORS")
 
     result = subprocess.run(
         ["sh", "-c", "echo 'output' && echo 'ERROR: failed' >&2"],
@@ -253,9 +262,7 @@ def filter_stderr() -> None:
 
     Process only specific error messages.
     """
-    print("\n" + "=" * 70)
-    print("FILTER STDERR")
-    print("=" * 70)
+    print_section("FILTER STDERR")
 
     result = subprocess.run(
         ["sh", "-c", "echo 'INFO: starting' >&2 && echo 'ERROR: failed' >&2 && echo 'WARNING: slow' >&2"],
@@ -288,14 +295,12 @@ def filter_stderr() -> None:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(SEPARATOR)
     print("STDERR HANDLING")
-    print("=" * 70)
+    print(SEPARATOR)
 
     # Separate
-    print("\n" + "=" * 70)
-    print("1. SEPARATE STDOUT AND STDERR")
-    print("=" * 70)
+    print_section("1. SEPARATE STDOUT AND STDERR")
     separate_stdout_stderr()
 
     # Combine
@@ -319,20 +324,22 @@ if __name__ == "__main__":
     # Filter
     filter_stderr()
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
 
     # Key takeaways
-    print("\nKEY TAKEAWAYS:")
-    print("-" * 70)
-    print("1. capture_output=True captures both stdout and stderr")
-    print("2. stderr=subprocess.STDOUT combines streams")
-    print("3. stderr=subprocess.DEVNULL suppresses errors")
-    print("4. Process stdout and stderr separately")
-    print("5. Check stderr for error detection")
-    print("6. Filter stderr by error level")
-    print("7. Each pipeline stage has its own stderr")
-    print("8. Use stderr for diagnostics and errors")
-    print("9. Can redirect stderr to stdout in pipes")
-    print("10. Always handle stderr appropriately")
-    print("=" * 70)
+    print("\n".join([
+        "\nKEY TAKEAWAYS:",
+        SUB_SEPARATOR,
+        "1. capture_output=True captures both stdout and stderr",
+        "2. stderr=subprocess.STDOUT combines streams",
+        "3. stderr=subprocess.DEVNULL suppresses errors",
+        "4. Process stdout and stderr separately",
+        "5. Check stderr for error detection",
+        "6. Filter stderr by error level",
+        "7. Each pipeline stage has its own stderr",
+        "8. Use stderr for diagnostics and errors",
+        "9. Can redirect stderr to stdout in pipes",
+        "10. Always handle stderr appropriately",
+        SEPARATOR,
+    ]))
 